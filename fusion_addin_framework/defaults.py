@@ -5,6 +5,7 @@ the random names names and default images.
 
 from pathlib import Path
 from uuid import uuid4
+from functools import lru_cache
 import random
 
 # dictionairy which maps the available image ids ti the corresponding directory path
@@ -108,10 +109,14 @@ def eval_name(value: str, cls) -> str:
     return value
 
 
+# the same few default images are evaluated for nearly every wrapper instance
+@lru_cache(maxsize=128)
 def eval_image(value: str, size=None) -> str:
     """Gets the path to an image directory or image path if the name is contained
     in the default image path directory.
 
+    The results are cached as they only depend on the arguments.
+
     Args:
         value (str): Path or name of a default image.
         size ([type], optional): Size of the image. If None the path to the directory
@@ -14,6 +14,8 @@ import adsk.core
 from . import messages as msgs
 
 
+_logger = logging.getLogger(__name__)
+
 # keep all handlers referenced
 handlers = []
 custom_events_and_handlers = []
@@ -63,20 +65,25 @@ def _notify_routine(
         action (Callable): The notify function of the event to execute.
         args (adsk.core.CommandEventArgs): The arguments passed to the notify function.
     """
-    logging.getLogger(__name__).info(msgs.starting_handler(event_name, cmd_name))
+    # handlers like mouseMove fire very often, so the messages are only formatted
+    # if they are going to be logged
+    log_info = _logger.isEnabledFor(logging.INFO)
+    if log_info:
+        _logger.info(msgs.starting_handler(event_name, cmd_name))
     try:
         start = time.perf_counter()
         action(event_args)
-        logging.getLogger(__name__).info(
-            msgs.handler_execution_time(
-                event_name, cmd_name, time.perf_counter() - start
+        if log_info:
+            _logger.info(
+                msgs.handler_execution_time(
+                    event_name, cmd_name, time.perf_counter() - start
+                )
             )
-        )
     except:
         # no exception gets raised outside the handlers so this try, except
         # block is mandatory to prevent silent errors !!!!!!!
         msg = msgs.handler_error(event_name, cmd_name, traceback.format_exc())
-        logging.getLogger(__name__).error(msg)
+        _logger.error(msg)
         if debug_to_ui:
             adsk.core.Application.get().userInterface.messageBox(msg)
 
@@ -101,6 +108,7 @@ class GenericCustomEventHandler(adsk.core.CustomEventHandler):
         self.action = action
         self.event = event
         self.debug_to_ui = debug_to_ui
+        self.event_name = f"{event.eventId} (custom event)"
 
         custom_events_and_handlers.append((event, self))
 
@@ -108,7 +116,7 @@ class GenericCustomEventHandler(adsk.core.CustomEventHandler):
         _notify_routine(
             self.debug_to_ui,
             "<no command>",
-            f"{self.event.eventId} (custom event)",
+            self.event_name,
             self.action,
             eventArgs,
         )
@@ -301,7 +309,7 @@ class CommandCreatedHandler_(adsk.core.CommandCreatedEventHandler):
             if handler_class is None:
                 # shouldnt happened
                 # just in case sanitation in AddinCommand hasnt worked properly
-                logging.getLogger(__name__).warning(msgs.unknown_event_name(event_name))
+                _logger.warning(msgs.unknown_event_name(event_name))
             else:
                 handler = handler_class(
                     self.debug_to_ui,
@@ -2,8 +2,8 @@
 # pylint:disable=unspecified-encoding
 # to avoid import error due to type hints in doc creation if adsk.core not available
 from __future__ import annotations
-from queue import Queue
-from typing import Any, Callable, Iterable, Dict, List, Union, Tuple
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, Dict, List, Union, Tuple
 import logging
 import json
 import enum
@@ -12,12 +12,15 @@ import time
 import threading
 import os
 from pathlib import Path
-from functools import wraps
+from functools import partial, wraps
+from operator import attrgetter
 
 import adsk.core, adsk.fusion
 
 from . import handlers
 
+_logger = logging.getLogger(__name__)
+
 
 ### LOGGING ###
 # region
@@ -50,8 +53,8 @@ def create_logger(
 
     # delete allexisting handlers, to ensure no duplicated handler is added
     # when this method is called twice
-    if logger.hasHandlers():
-        logger.handlers.clear()
+    # (hasHandlers() would also walk up the parents, only own handlers matter here)
+    logger.handlers.clear()
 
     # logging format (for all handlers)
     formatter = logging.Formatter(message_format, style="{")
@@ -65,22 +68,102 @@ def create_logger(
 
 
 class TextPaletteLoggingHandler(logging.StreamHandler):
-    def __init__(self):
+    def __init__(
+        self,
+        capacity: int = 1,
+        flush_level: int = logging.WARNING,
+        event_id: str = None,
+    ):
         """Logging handler utilizing Fusions text command pallete.
 
         Using this logging handler logging messages will be displayed in the
         text command palette in the Fusion GUI.
         The TextCommand palette needs to be accessed manually.
+
+        Every write to the palette is a call into the Fusion API. If a lot of messages
+        are logged the formatted records can be buffered and written to the palette
+        together by using a capacity greater than 1.
+
+        Args:
+            capacity (int, optional): The number of records which are buffered before
+                they are written to the palette. Defaults to 1 (every record is written
+                directly).
+            flush_level (int, optional): Records of this level or higher are written
+                directly together with all buffered records. Defaults to logging.WARNING.
+            event_id (str, optional): The id of a custom event created with
+                'create_custom_event' where generic_use was set to True. If given,
+                records logged from other threads are buffered and written together
+                from this event in Fusions main thread. Defaults to None (records are
+                written from the thread which logs them).
+
+        Raises:
+            ValueError: If event_id is given but no generic custom event with this id
+                has been created.
         """
+        if event_id is not None and event_id not in _custom_event_queues:
+            raise ValueError(
+                f"There is no custom event with the id '{event_id}' which was created "
+                + "for generic use."
+            )
+
         super().__init__()
         self.textPalette = adsk.core.Application.get().userInterface.palettes.itemById(
             "TextCommands"
         )
         # self.textPalette.isVisible = True
 
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.event_id = event_id
+        self._buffer = []
+        self._flush_scheduled = False
+        # the same object is queued every time so duplicates can be skipped
+        self._queued_flush = self.flush
+
     def emit(self, record):
-        self.textPalette.writeText(self.format(record))
-        # adsk.doEvents() # doesnt seem to be necessary
+        self._buffer.append(self.format(record))
+        # records from the main thread (including the ones logged while handling the
+        # event) are written directly, otherwise the event would retrigger itself
+        in_main_thread = threading.current_thread() is threading.main_thread()
+        if self.event_id is not None and not in_main_thread:
+            # a queued flush might get dropped from a full event queue (see
+            # max_queued_actions) and would never reset the flag, therefore a full
+            # buffer requests a flush again
+            if not self._flush_scheduled or len(self._buffer) >= self.capacity:
+                try:
+                    execute_from_event(
+                        self._queued_flush, self.event_id, skip_duplicate=True
+                    )
+                except Exception:  # pylint:disable=broad-except
+                    self._flush_scheduled = False
+                    self.handleError(record)
+                else:
+                    self._flush_scheduled = True
+        elif len(self._buffer) >= self.capacity or record.levelno >= self.flush_level:
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered records to the text palette with a single call."""
+        self.acquire()
+        try:
+            if self._buffer:
+                # logging.shutdown flushes and closes the handler while Fusion unloads
+                # the addin, the palette might already be gone at this point and
+                # shutdown does not catch the RuntimeError of the API
+                try:
+                    if self.textPalette.isValid:
+                        self.textPalette.writeText("\n".join(self._buffer))
+                        # adsk.doEvents() # doesnt seem to be necessary
+                except RuntimeError:
+                    pass
+                self._buffer.clear()
+            self._flush_scheduled = False
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        super().close()
 
 
 # endregion
@@ -101,6 +184,47 @@ class InputIdsBase(enum.Enum):
         return name + "_input_id"
 
 
+def _get_value(command_input: adsk.core.CommandInput) -> Any:
+    return command_input.value
+
+
+def _get_slider_value(command_input: adsk.core.CommandInput) -> Any:
+    val = command_input.valueOne
+    if command_input.hasTwoSliders:
+        val = (val, command_input.valueTwo)
+    return val
+
+
+def _get_selection_value(command_input: adsk.core.CommandInput) -> List[Any]:
+    return [
+        command_input.selection(i).entity for i in range(command_input.selectionCount)
+    ]
+
+
+def _get_list_value(command_input: adsk.core.CommandInput) -> List[Any]:
+    return [item for item in command_input.listItems if item.isSelected]
+
+
+# maps the objectType of the command inputs to the function which extracts their value
+# value types have no special super class (like SliderCommandInput) so every type
+# is listed explicitly
+_value_getters = {
+    adsk.core.AngleValueCommandInput.classType(): _get_value,
+    adsk.core.BoolValueCommandInput.classType(): _get_value,
+    adsk.core.DistanceValueCommandInput.classType(): _get_value,
+    adsk.core.FloatSpinnerCommandInput.classType(): _get_value,
+    adsk.core.IntegerSpinnerCommandInput.classType(): _get_value,
+    adsk.core.ValueCommandInput.classType(): _get_value,
+    adsk.core.StringValueCommandInput.classType(): _get_value,
+    adsk.core.FloatSliderCommandInput.classType(): _get_slider_value,
+    adsk.core.IntegerSliderCommandInput.classType(): _get_slider_value,
+    adsk.core.SelectionCommandInput.classType(): _get_selection_value,
+    adsk.core.ButtonRowCommandInput.classType(): _get_list_value,
+    adsk.core.DropDownCommandInput.classType(): _get_list_value,
+    adsk.core.RadioButtonGroupCommandInput.classType(): _get_list_value,
+}
+
+
 def get_values(current_inputs: adsk.core.CommandInputs) -> Dict[str, Any]:
     """Extracts the command values from the given CommandInputs collections and maps
     them to the id of their command.
@@ -112,73 +236,42 @@ def get_values(current_inputs: adsk.core.CommandInputs) -> Dict[str, Any]:
 
     Returns:
         Dict[str, Any]: The values of the current command inputs mapped by their id. If multiple values
-            can be selected a corresponding list is returned.
+            can be selected a corresponding list is returned. Command inputs which have
+            no value (like a TextBoxCommandInput) are mapped to the command input itself.
     """
-    # value types have no special super class (like SliderCommandInput)
-    # for consistency for all types lists are used
-    value_types = [
-        adsk.core.AngleValueCommandInput.classType(),
-        adsk.core.BoolValueCommandInput.classType(),
-        adsk.core.DistanceValueCommandInput.classType(),
-        adsk.core.FloatSpinnerCommandInput.classType(),
-        adsk.core.IntegerSpinnerCommandInput.classType(),
-        adsk.core.ValueCommandInput.classType(),
-        adsk.core.StringValueCommandInput.classType(),
-        adsk.core.FloatSpinnerCommandInput.classType(),
-        adsk.core.IntegerSpinnerCommandInput.classType(),
-    ]
-
-    slider_types = [
-        adsk.core.FloatSliderCommandInput.classType(),
-        adsk.core.IntegerSliderCommandInput.classType(),
-    ]
-
-    list_types = [
-        adsk.core.ButtonRowCommandInput.classType(),
-        adsk.core.DropDownCommandInput.classType(),
-        adsk.core.RadioButtonGroupCommandInput.classType(),
-    ]
-
-    selection_types = [adsk.core.SelectionCommandInput.classType()]
-
     input_values = {}
 
     for command_input in current_inputs:
-
-        if command_input.objectType in value_types:
-            input_values[command_input.id] = command_input.value
-
-        elif command_input.objectType in slider_types:
-            val = command_input.valueOne
-            if command_input.hasTwoSliders:
-                val = (val, command_input.valueTwo)
-            input_values[command_input.id] = val
-
-        elif command_input.objectType in selection_types:
-            input_values[command_input.id] = [
-                command_input.selection(i).entity
-                for i in range(command_input.selectionCount)
-            ]
-
-        elif command_input.objectType in list_types:
-            input_values[command_input.id] = [
-                item for item in command_input.listItems if item.isSelected
-            ]
-
-        input_values[command_input.id] = command_input
+        value_getter = _value_getters.get(command_input.objectType)
+        if value_getter is not None:
+            input_values[command_input.id] = value_getter(command_input)
+        else:
+            input_values[command_input.id] = command_input
 
     return input_values
 
 
 class AppObjects:
-    """Collection allowing simplified access to frequtnly used API objects."""
+    """Collection allowing simplified access to frequtnly used API objects.
+
+    The session wide objects (the user interface and its collections) are resolved
+    on first access and cached until :meth:`reload_app` is called. Objects depending
+    on the active document or viewport are queried on every access as they change
+    when the user switches documents.
+    """
 
     def __init__(self):
         self._app = None
+        self._user_interface = None
+        self._command_definitions = None
+        self._workspaces = None
         self.reload_app()
 
     def reload_app(self):
         self._app = adsk.core.Application.cast(adsk.core.Application.get())
+        self._user_interface = None
+        self._command_definitions = None
+        self._workspaces = None
 
     @property
     def app(self):
@@ -190,7 +283,9 @@ class AppObjects:
 
     @property
     def userInterface(self):
-        return self._app.userInterface
+        if self._user_interface is None:
+            self._user_interface = self._app.userInterface
+        return self._user_interface
 
     @property
     def design(self):
@@ -198,11 +293,15 @@ class AppObjects:
 
     @property
     def commandDefinitions(self):
-        return self._app.userInterface.commandDefinitions
+        if self._command_definitions is None:
+            self._command_definitions = self.userInterface.commandDefinitions
+        return self._command_definitions
 
     @property
     def workspaces(self):
-        return self._app.userInterface.workspaces
+        if self._workspaces is None:
+            self._workspaces = self.userInterface.workspaces
+        return self._workspaces
 
     @property
     def activeViewport(self):
@@ -214,6 +313,12 @@ class AppObjects:
 
 ### COMPONENT RELATED ###
 # region
+# the transform is copied into the new occurrence so one identity matrix can be
+# shared by all calls instead of creating a new one for every component, like the
+# other cached API objects it is created on first use and not on import
+_identity_matrix = None
+
+
 def new_component(
     name: str = None, parent: adsk.fusion.Component = None
 ) -> adsk.fusion.Component:
@@ -226,11 +331,15 @@ def new_component(
     Returns:
         adsk.fusion.Component: The created component.
     """
+    global _identity_matrix  # pylint:disable=global-statement
+
+    if _identity_matrix is None:
+        _identity_matrix = adsk.core.Matrix3D.create()
     if parent is None:
         parent = adsk.fusion.Design.cast(
             adsk.core.Application.get().activeProduct
         ).rootComponent
-    comp = parent.occurrences.addNewComponent(adsk.core.Matrix3D.create()).component
+    comp = parent.occurrences.addNewComponent(_identity_matrix).component
     if name:
         comp.name = name
     return comp
@@ -242,12 +351,26 @@ def delete_component(component: adsk.fusion.Component):
     Args:
         component (adsk.fusion.Component): The component to delete.
     """
-    for occ in adsk.fusion.Design.cast(
-        adsk.core.Application.get().activeProduct
-    ).rootComponent.allOccurrencesByComponent(component):
+    occurrences = list(
+        adsk.fusion.Design.cast(
+            adsk.core.Application.get().activeProduct
+        ).rootComponent.allOccurrencesByComponent(component)
+    )
+    # the snapshot is not invalidated by the deletions, deleting from the back
+    # avoids that the remaining occurrences need to be shifted
+    for occ in reversed(occurrences):
         occ.deleteMe()
 
 
+_lightbulb_attrs = (
+    "isBodiesFolderLightBulbOn",
+    "isConstructionFolderLightBulbOn",
+    "isJointsFolderLightBulbOn",
+    "isOriginFolderLightBulbOn",
+    "isSketchFolderLightBulbOn",
+)
+
+
 def make_comp_invisible(comp: adsk.fusion.Component):
     """Disables the visibility of all occurrences of the passed component.
 
@@ -255,18 +378,14 @@ def make_comp_invisible(comp: adsk.fusion.Component):
         comp (adsk.fusion.Component): The component to hide
 
     Returns:
-        _type_: _description_
+        Tuple[List[str], List[adsk.fusion.Occurrence]]: The names of the lightbulb
+            attributes and the occurrences which were switched off.
     """
-    libghtbulbs = [
-        "isBodiesFolderLightBulbOn",
-        "isConstructionFolderLightBulbOn",
-        "isJointsFolderLightBulbOn",
-        "isOriginFolderLightBulbOn",
-        "isSketchFolderLightBulbOn",
-    ]
-    active_lightbulbs = [attr for attr in libghtbulbs if getattr(comp, attr)]
-    for libghtbulb_attr in active_lightbulbs:
-        setattr(comp, libghtbulb_attr, False)
+    active_lightbulbs = []
+    for lightbulb_attr in _lightbulb_attrs:
+        if getattr(comp, lightbulb_attr):
+            setattr(comp, lightbulb_attr, False)
+            active_lightbulbs.append(lightbulb_attr)
 
     visible_occs = []
     for occ in comp.occurrences:
@@ -288,30 +407,71 @@ def clear_collection(collection: adsk.core.ObjectCollection):
     Args:
         collection (adsk.core.ObjectCollection): The collection to clear.
     """
-    while collection.count > 0:
-        collection.item(0).deleteMe()
+    # collection.clear() must not be used as e.g. ObjectCollection.clear() only removes
+    # the references from the collection without deleting the items themselves
+    # deleting from the back avoids that the remaining items need to be shifted
+    for i in reversed(range(collection.count)):
+        item = collection.item(i)
+        if item is not None:
+            item.deleteMe()
+
+
+def _iter_items_by_attribute(
+    collection: adsk.core.ObjectCollection, attribute_name: str, attribute_value: Any
+) -> Iterator[Any]:
+    """Returns an iterator over all objects of a collection whose attribute with the given
+    name has the given value. The objects are only compared while iterating. Shared by
+    :func:`items_by_attribute` and :func:`first_item_by_attribute`.
+
+    Args:
+        collection (adsk.core.ObjectCollection): The object collection to query.
+        attribute_name (str): The name of the attribute for comparison. Dotted names
+            (e.g. "component.name") are resolved like in operator.attrgetter.
+        attribute_value (Any): The value of the attribute for comparison.
+
+    Returns:
+        Iterator[Any]: The objects which meet the attribute condition.
+    """
+    get_attribute = attrgetter(attribute_name)
+    return (item for item in collection if get_attribute(item) == attribute_value)
 
 
 def items_by_attribute(
     collection: adsk.core.ObjectCollection, attribute_name: str, attribute_value: Any
 ) -> List[Any]:
-    """Returns all objects of a collections whose attribute with the given name have the
+    """Returns all objects of a collection whose attribute with the given name has the
     given value.
 
     Args:
         collection (adsk.core.ObjectCollection): The object collection to query.
-        attribute_name (str): The name of the attribute for comparison.
+        attribute_name (str): The name of the attribute for comparison. Dotted names
+            (e.g. "component.name") are resolved like in operator.attrgetter.
         attribute_value (Any): The value of the attribute for comparison.
 
     Returns:
         List[Any]: The found objects which met the attribute condition.
     """
+    return list(_iter_items_by_attribute(collection, attribute_name, attribute_value))
+
+
+def first_item_by_attribute(
+    collection: adsk.core.ObjectCollection, attribute_name: str, attribute_value: Any
+) -> Any:
+    """Returns the first object of a collection whose attribute with the given name has
+    the given value. The search stops at the first match.
+
+    Args:
+        collection (adsk.core.ObjectCollection): The object collection to query.
+        attribute_name (str): The name of the attribute for comparison. Dotted names
+            (e.g. "component.name") are resolved like in operator.attrgetter.
+        attribute_value (Any): The value of the attribute for comparison.
 
-    found_items = []
-    for item in collection:
-        if getattr(item, attribute_name) == attribute_value:
-            found_items.append(item)
-    return found_items
+    Returns:
+        Any: The found object or None if no object meets the attribute condition.
+    """
+    return next(
+        _iter_items_by_attribute(collection, attribute_name, attribute_value), None
+    )
 
 
 # endregion
@@ -319,6 +479,9 @@ def items_by_attribute(
 
 ### HUB REALTED ###
 # region
+_data_folders = {}  # {(hub_id, *fusion_path): data_folder}
+
+
 def get_data_folder(
     fusion_path: List[str], create_folders=False
 ) -> adsk.core.DataFolder:
@@ -326,6 +489,9 @@ def get_data_folder(
     a list in the form [<project_name>,<folder>,<subfolder>,<subfolder>,...] which describes
     the position of the data folder.
 
+    Resolved folders are cached by the active hub and their "fusion path" as long as
+    they are valid. Use :func:`clear_data_folder_cache` if folders got moved or renamed.
+
     Args:
         fusion_path (List[str]): The path of the fusion data folder in the form [<project_name>,<folder>,<subfolder>,<subfolder>,...].
         create_folders (bool, optional): Indicates if new folders should be created if a folder
@@ -340,6 +506,12 @@ def get_data_folder(
     """
     app = adsk.core.Application.get()
 
+    # the folders of a previously active hub stay valid after switching the hub
+    path_key = (app.data.activeHub.id, *fusion_path)
+    folder = _data_folders.get(path_key)
+    if folder is not None and folder.isValid:
+        return folder
+
     project_name = fusion_path[0]
     folders = fusion_path[1:]
 
@@ -353,18 +525,25 @@ def get_data_folder(
 
     folder = project.rootFolder
     for sub_folder in folders:
-        folder = folder.dataFolders.itemByName(sub_folder)
+        parent_folder = folder
+        folder = parent_folder.dataFolders.itemByName(sub_folder)
         if folder is None:
             if create_folders:
-                folder = folder.dataFolder.add(sub_folder)
+                folder = parent_folder.dataFolders.add(sub_folder)
             else:
                 raise FileNotFoundError(
                     f"There is no file with the provided fusion path {fusion_path}"
                 )
 
+    _data_folders[path_key] = folder
     return folder
 
 
+def clear_data_folder_cache():
+    """Removes all data folders cached by :func:`get_data_folder`."""
+    _data_folders.clear()
+
+
 def get_doc(fusion_path: List[str], tolerance_search=False) -> adsk.core.DataFile:
     """Searches the data hub for a document folder at the given "fusion path". A "fusion path" is
     a list in the form [<project_name>,<folder>,<subfolder>,<subfolder>,...,<file_name>] which describes
@@ -382,8 +561,11 @@ def get_doc(fusion_path: List[str], tolerance_search=False) -> adsk.core.DataFil
     folder = get_data_folder(fusion_path[:-1])
 
     if tolerance_search:
+        # as the searched name is stripped, stripping the file names would not change
+        # the result of the containment check
+        doc_name = doc_name.strip().lower()
         for doc in folder.dataFiles:
-            if doc_name.strip().lower() in doc.name.strip().lower():
+            if doc_name in doc.name.lower():
                 return doc
     else:
         for doc in folder.dataFiles:
@@ -400,6 +582,30 @@ def get_doc(fusion_path: List[str], tolerance_search=False) -> adsk.core.DataFil
 
 ### CAMERA ###
 # region
+_quarter_pi = math.pi * 0.25
+
+
+def _view_extents(
+    measure: float,
+    is_horizontal_measure: bool,
+    viewport_width: int,
+    viewport_height: int,
+) -> float:
+    """Calculates the viewExtents parameter for the given measure and viewport size.
+    See view_extents_by_measure for details."""
+    is_horizontal_viewport = viewport_width > viewport_height
+
+    if is_horizontal_viewport and is_horizontal_measure:
+        factor = viewport_height / viewport_width
+    elif not is_horizontal_viewport and not is_horizontal_measure:
+        factor = viewport_width / viewport_height
+    else:
+        factor = 1
+
+    # area of the circle with the (scaled) measure as diameter
+    return _quarter_pi * (factor * measure) ** 2
+
+
 def view_extents_by_measure(measure: float, is_horizontal_measure: bool = True):
     """Returns the viewExtents parameter so the given model measure fits exactly
     into the viewport.
@@ -413,18 +619,9 @@ def view_extents_by_measure(measure: float, is_horizontal_measure: bool = True):
         float: the viewExtents parameter to apply
     """
     viewport = adsk.core.Application.get().activeViewport
-    is_horizontal_viewport = viewport.width > viewport.height
-
-    if is_horizontal_viewport and is_horizontal_measure:
-        factor = viewport.height / viewport.width
-    elif not is_horizontal_viewport and not is_horizontal_measure:
-        factor = viewport.width / viewport.height
-    else:
-        factor = 1
-
-    radius = factor * measure * 0.5
-    extent = math.pi * (radius**2)
-    return extent
+    return _view_extents(
+        measure, is_horizontal_measure, viewport.width, viewport.height
+    )
 
 
 def view_extent_by_rectangle(horizontal: float, vertical: float):
@@ -438,9 +635,12 @@ def view_extent_by_rectangle(horizontal: float, vertical: float):
     Returns:
         float: the viewExtents parameter to apply
     """
+    # query the viewport only once for both measures
+    viewport = adsk.core.Application.get().activeViewport
+    viewport_width, viewport_height = viewport.width, viewport.height
     return max(
-        view_extents_by_measure(horizontal, True),
-        view_extents_by_measure(vertical, False),
+        _view_extents(horizontal, True, viewport_width, viewport_height),
+        _view_extents(vertical, False, viewport_width, viewport_height),
     )
 
 
@@ -515,6 +715,17 @@ def set_camera_viewarea(
     return camera
 
 
+# the eye direction of each side of the viewcube
+_viewcube_side_eyes = {
+    "back": (0, 1, 0),
+    "front": (0, -1, 0),
+    "right": (1, 0, 0),
+    "left": (-1, 0, 0),
+    "top": (0, 0, 1),
+    "bottom": (0, 0, -1),
+}
+
+
 def set_camera_viewcube(
     view: Tuple[str],
     camera: adsk.core.Camera = None,
@@ -541,23 +752,16 @@ def set_camera_viewcube(
     Returns:
         adsk.core.Camera: The adjusted camera.
     """
-    side_eyes = {
-        "back": adsk.core.Vector3D.create(0, 1, 0),
-        "front": adsk.core.Vector3D.create(0, -1, 0),
-        "right": adsk.core.Vector3D.create(1, 0, 0),
-        "left": adsk.core.Vector3D.create(-1, 0, 0),
-        "top": adsk.core.Vector3D.create(0, 0, 1),
-        "bottom": adsk.core.Vector3D.create(0, 0, -1),
-    }
-
     # input validaion to prevent hard to fix bugsx
     # if isinstance(view, str):
     #     view = view.lower()
-    #     legal_words = "|".join(side_eyes.keys())
+    #     legal_words = "|".join(_viewcube_side_eyes.keys())
     #     if not re.fullmatch(f"({legal_words})+", view):
     #         raise ValueError("Invalid view argument.")
     #     view = re.findall(legal_words, view)  # convert to list
 
+    # the sides are iterated multiple times, so any iterable is converted once
+    view = tuple(view)
     if len(view) > len(set(view)):
         raise ValueError("Invalid view argument.")
 
@@ -567,27 +771,26 @@ def set_camera_viewcube(
     # prevent bug by not setting to exactly 0
     camera.target = adsk.core.Point3D.create(0.00001, 0.00001, 0.00001)
 
-    eye = adsk.core.Vector3D.create(0, 0, 0)
-    i_vectors = 0
+    # sum up the eye directions in python and create only the final point in Fusion
+    eye_x, eye_y, eye_z = 0, 0, 0
     for side in view:
-        eye.add(side_eyes[side])
-        i_vectors += 1
+        side_x, side_y, side_z = _viewcube_side_eyes[side]
+        eye_x += side_x
+        eye_y += side_y
+        eye_z += side_z
 
-    if eye.length < 0.9:
+    eye_length = math.sqrt(eye_x**2 + eye_y**2 + eye_z**2)
+    if eye_length < 0.9:
         raise ValueError("Invalid view argument.")
 
-    up_vector = adsk.core.Vector3D.create(0, 0, 1)
-    if i_vectors == 1:
-        if eye.z == 0:
-            up_vector = adsk.core.Vector3D.create(0, 0, 1)
-        else:
-            up_vector = adsk.core.Vector3D.create(0, 1, 0)
-
-    camera.upVector = up_vector
+    if len(view) == 1 and eye_z != 0:
+        camera.upVector = adsk.core.Vector3D.create(0, 1, 0)
+    else:
+        camera.upVector = adsk.core.Vector3D.create(0, 0, 1)
 
-    eye.normalize()
-    eye = eye.asPoint()
-    camera.eye = eye
+    camera.eye = adsk.core.Point3D.create(
+        eye_x / eye_length, eye_y / eye_length, eye_z / eye_length
+    )
 
     if apply_camera:
         adsk.core.Application.get().activeViewport.camera = camera
@@ -627,6 +830,13 @@ def camera_zoom(
 
 ### MISC ###
 # region
+# the control types are constant so they are only resolved once at import, these are
+# plain strings of the bindings and no objects of the application
+_command_control_type = adsk.core.CommandControl.classType()
+_dropdown_control_type = adsk.core.DropDownControl.classType()
+_split_button_control_type = adsk.core.SplitButtonControl.classType()
+
+
 def ui_ids_dict(out_file_path=None) -> Dict:
     """Dumps the ids of the fusion user interface element to a hierachical dict.
 
@@ -641,77 +851,83 @@ def ui_ids_dict(out_file_path=None) -> Dict:
         Dict: A dictionairy which represents the full user interface.
     """
 
-    def get_controls(parent):
-        controls = {}
-        for ctrl in parent.controls:
-            if ctrl.objectType == adsk.core.CommandControl.classType():
+    ui = adsk.core.Application.get().userInterface
+
+    # (controls_dict, parent) pairs whose controls still need to be collected
+    # an explicit stack is used instead of recursing into every (nested) dropdown
+    pending = []
+
+    workspaces = {}
+    for ws in ui.workspaces:
+        # in this workspace attributes access results in error
+        if ws.id == "DebugEnvironment":
+            continue
+        tabs = {}
+        for tab in ws.toolbarTabs:
+            panels = {}
+            # some panels collections contina None elements
+            # these collections will also raise errors when iterating over it or using .item()
+            # thererfore [] must be used for iterating over them
+            toolbar_panels = tab.toolbarPanels
+            for i in range(toolbar_panels.count):
+                panel = toolbar_panels[i]
+                if panel is not None:
+                    panels[panel.id] = {}
+                    pending.append((panels[panel.id], panel))
+            tabs[tab.id] = panels
+        workspaces[ws.id] = tabs
+
+    toolbars = {}
+    for toolbar in ui.toolbars:
+        toolbars[toolbar.id] = {}
+        pending.append((toolbars[toolbar.id], toolbar))
+
+    while pending:
+        controls, parent = pending.pop()
+        # read the count once and index directly (as for the toolbar panels above)
+        parent_controls = parent.controls
+        for i in range(parent_controls.count):
+            ctrl = parent_controls[i]
+            object_type = ctrl.objectType
+            if object_type == _command_control_type:
                 cmd_def_id = None
                 # for come controls the commnd defintion is not acceisble
                 try:
-                    cmd_def_id = ctrl.commandDefinition.id
-                except:
+                    cmd_def = ctrl.commandDefinition
+                    if cmd_def is not None:
+                        cmd_def_id = cmd_def.id
+                except RuntimeError:
                     pass
                 controls[ctrl.id] = cmd_def_id
-            elif ctrl.objectType == adsk.core.DropDownControl.classType():
-                controls[ctrl.id] = get_controls(ctrl)
-            elif ctrl.objectType == adsk.core.SplitButtonControl.classType():
-                cmd_def_ids = []
+            elif object_type == _dropdown_control_type:
+                controls[ctrl.id] = {}
+                pending.append((controls[ctrl.id], ctrl))
+            elif object_type == _split_button_control_type:
+                default_cmd_def_id = None
                 try:
-                    cmd_def_ids.append(ctrl.defaultCommandDefinition.id)
-                except:
-                    cmd_def_ids.append(None)
+                    default_cmd_def = ctrl.defaultCommandDefinition
+                    if default_cmd_def is not None:
+                        default_cmd_def_id = default_cmd_def.id
+                except RuntimeError:
+                    pass
+                additional_cmd_def_ids = [None]
                 try:
-                    for cmd_def in ctrl.additionalDefinitions:
-                        cmd_def_id.append(cmd_def.id)
-                except:
-                    cmd_def_ids.append(None)
-
-                controls[ctrl.id] = cmd_def_ids
-
-        return controls
-
-    def get_panels(tab):
-        panels = {}
-        # some panels collections contina None elements
-        # these collections will also raise errors when iterating over it or using .item()
-        # thererfore [] must be used for iterating over them
-        for i in range(tab.toolbarPanels.count):
-            panel = tab.toolbarPanels[i]
-            if panel is not None:
-                panels[panel.id] = get_controls(panel)
-        return panels
-
-    def get_tabs(ws):
-        tabs = {}
-        for tab in ws.toolbarTabs:
-            tabs[tab.id] = get_panels(tab)
-        return tabs
-
-    def get_workspaces(ui):
-        workspaces = {}
-        for ws in ui.workspaces:
-            # in this workspace attributes access results in error
-            if ws.id != "DebugEnvironment":
-                workspaces[ws.id] = get_tabs(ws)
-        return workspaces
-
-    def get_toolbars(ui):
-        toolbars = {}
-        for toolbar in ui.toolbars:
-            toolbars[toolbar.id] = get_controls(toolbar)
-        return toolbars
-
-    def get_palettes(ui):
-        paletts = []
-        for pallet in ui.palettes:
-            paletts.append(pallet.id)
-        return paletts
+                    additional_cmd_defs = ctrl.additionalDefinitions
+                    if additional_cmd_defs is not None:
+                        # single definitions might be inaccessible as well
+                        additional_cmd_def_ids = [
+                            None if cmd_def is None else cmd_def.id
+                            for cmd_def in additional_cmd_defs
+                        ]
+                except RuntimeError:
+                    pass
+
+                controls[ctrl.id] = [default_cmd_def_id, *additional_cmd_def_ids]
 
-    ui = adsk.core.Application.get().userInterface
     ui_dict = {}
-    ui_dict["workspaces"] = get_workspaces(ui)
-    ui_dict["toolbars"] = get_toolbars(ui)
-    ui_dict["pallets"] = get_palettes(ui)
+    ui_dict["workspaces"] = workspaces
+    ui_dict["toolbars"] = toolbars
+    ui_dict["pallets"] = [pallet.id for pallet in ui.palettes]
 
     if out_file_path is not None:
         with open(Path(out_file_path), "w+") as f:
@@ -720,23 +936,69 @@ def ui_ids_dict(out_file_path=None) -> Dict:
     return ui_dict
 
 
+_appearance_library = None
+_appearances = {}  # {material_name: appearance}
+
+
 def get_appearance(material_name: str) -> adsk.core.Appearance:
     """Gets the appearance with the passed name from the Fusion 360 Appearance Library.
 
+    The library and the fetched appearances are cached, so only the first request of
+    an appearance needs to query the library. Use :func:`clear_appearance_cache` to
+    reset the cache.
+
     Args:
         material_name (str): The name of the apperance to fetch.
 
     Returns:
         adsk.core.Appearnce: The appearance.
     """
-    material = (
-        adsk.core.Application.get()
-        .materialLibraries.itemByName("Fusion 360 Appearance Library")
-        .appearances.itemByName(material_name)
-    )
+    global _appearance_library  # pylint:disable=global-statement
+
+    material = _appearances.get(material_name)
+    if material is None:
+        if _appearance_library is None:
+            _appearance_library = (
+                adsk.core.Application.get().materialLibraries.itemByName(
+                    "Fusion 360 Appearance Library"
+                )
+            )
+        material = _appearance_library.appearances.itemByName(material_name)
+        # do not cache missing appearances as None would be returned forever
+        if material is not None:
+            _appearances[material_name] = material
     return material
 
 
+def clear_appearance_cache():
+    """Removes the library and all appearances cached by :func:`get_appearance`."""
+    global _appearance_library  # pylint:disable=global-statement
+
+    _appearance_library = None
+    _appearances.clear()
+
+
+# the axis directions are only read when creating oriented bounding boxes
+# so the same vector instances can be shared by all calls (see _get_axes)
+_axes = None
+
+
+def _get_axes() -> Tuple[adsk.core.Vector3D, adsk.core.Vector3D]:
+    """Returns the shared x and y axis vectors, they are created on first use.
+
+    Returns:
+        Tuple[adsk.core.Vector3D, adsk.core.Vector3D]: The x axis and the y axis.
+    """
+    global _axes  # pylint:disable=global-statement
+
+    if _axes is None:
+        _axes = (
+            adsk.core.Vector3D.create(1, 0, 0),
+            adsk.core.Vector3D.create(0, 1, 0),
+        )
+    return _axes
+
+
 def orient_bounding_box(
     bounding_box: adsk.core.BoundingBox3D,
 ) -> adsk.core.OrientedBoundingBox3D:
@@ -749,23 +1011,17 @@ def orient_bounding_box(
         adsk.core.OrientedBoundingBox3D: The oriented bounding box.
     """
     # do not use numpy to have no third party dependencies on apper
-    diagonal = [
-        max_coord - min_coord
-        for max_coord, min_coord in zip(
-            bounding_box.minPoint.asArray(), bounding_box.maxPoint.asArray()
-        )
-    ]
-    center = [
-        min_coord + dia_coord / 2
-        for min_coord, dia_coord in zip(bounding_box.minPoint.asArray(), diagonal)
-    ]
+    min_x, min_y, min_z = bounding_box.minPoint.asArray()
+    max_x, max_y, max_z = bounding_box.maxPoint.asArray()
+    dx, dy, dz = max_x - min_x, max_y - min_y, max_z - min_z
+    x_axis, y_axis = _get_axes()
     oriented_box = adsk.core.OrientedBoundingBox3D.create(
-        adsk.core.Point3D.create(*center),
-        adsk.core.Vector3D.create(1, 0, 0),
-        adsk.core.Vector3D.create(0, 1, 0),
-        abs(diagonal[0]),
-        abs(diagonal[1]),
-        abs(diagonal[2]),
+        adsk.core.Point3D.create(min_x + dx / 2, min_y + dy / 2, min_z + dz / 2),
+        x_axis,
+        y_axis,
+        abs(dx),
+        abs(dy),
+        abs(dz),
     )
     return oriented_box
 
@@ -778,6 +1034,11 @@ def delete_all_graphics():
     adsk.core.Application.get().activeViewport.refresh()
 
 
+# the TemporaryBRepManager is a singleton, it is fetched on first use as the
+# application might not be fully available when the module gets imported
+_temporary_brep_manager = None
+
+
 def create_cube(
     center: Tuple[Union[float, int]], side_length: float
 ) -> adsk.fusion.BRepBody:
@@ -791,11 +1052,16 @@ def create_cube(
     Returns:
         adsk.fusion.BRepBody: The transient instance of the created cube.
     """
-    return adsk.fusion.TemporaryBRepManager.get().createBox(
+    global _temporary_brep_manager  # pylint:disable=global-statement
+
+    if _temporary_brep_manager is None:
+        _temporary_brep_manager = adsk.fusion.TemporaryBRepManager.get()
+    x_axis, y_axis = _get_axes()
+    return _temporary_brep_manager.createBox(
         adsk.core.OrientedBoundingBox3D.create(
             adsk.core.Point3D.create(*center),
-            adsk.core.Vector3D.create(1, 0, 0),
-            adsk.core.Vector3D.create(0, 1, 0),
+            x_axis,
+            y_axis,
             side_length,
             side_length,
             side_length,
@@ -856,14 +1122,23 @@ def get_json_from_file(
     if default_value is None:
         default_value = {}
 
-    if not os.path.exists(os.path.dirname(path)):
-        os.makedirs(os.path.dirname(path))
-    if not os.path.exists(path):
-        with open(path, "w+") as f:
-            json.dump(default_value, f)  # do not add indent !!!
-    with open(path, "r+") as f:
-        json_data = json.load(f)
-    return json_data
+    try:
+        with open(path, "rb") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        json_str = json.dumps(default_value)  # do not add indent !!!
+        with open(path, "w") as f:
+            f.write(json_str)
+        # return a decoded copy so the passed default value is not shared with the caller
+        return json.loads(json_str)
+
+
+# the ordinal suffix for every value of n % 100 with the 11th, 12th and 13th exceptions
+_ordinal_suffixes = tuple(
+    "th" if 11 <= i <= 13 else ("th", "st", "nd", "rd", "th")[min(i % 10, 4)]
+    for i in range(100)
+)
 
 
 def make_ordinal(n: int) -> str:
@@ -882,14 +1157,20 @@ def make_ordinal(n: int) -> str:
         str: The resulting string.
     """
     n = int(n)
-    suffix = ["th", "st", "nd", "rd", "th"][min(n % 10, 4)]
-    if 11 <= (n % 100) <= 13:
-        suffix = "th"
-    return str(n) + suffix
+    return str(n) + _ordinal_suffixes[n % 100]
 
 
 class AnnotatedTimer(threading.Timer):
     def __init__(self, *args, **kwargs) -> None:
+        """A threading.Timer which remembers the time at which it will execute.
+
+        This timer is not used by the PeriodicExecuter anymore but is kept as part
+        of the public API.
+
+        Args:
+            *args: Passed to threading.Timer.
+            **kwargs: Passed to threading.Timer.
+        """
         super().__init__(*args, **kwargs)
         self._execution_timestamp = None
 
@@ -899,6 +1180,8 @@ class AnnotatedTimer(threading.Timer):
 
     @property
     def execution_timestamp(self):
+        """The perf_counter time at which the function will be executed. None if the
+        timer has not been started yet."""
         return self._execution_timestamp
 
 
@@ -909,9 +1192,14 @@ class PeriodicExecuter:
         action: Callable,
         wait_for_action: bool = False,
         initial_execution: bool = False,
+        event_id: str = None,
     ):
         """Creates an executer which executes the passed action periodically.
 
+        The action gets executed from a background thread. Actions which use the
+        Fusion API should be executed from within a custom event by passing an
+        event_id. Otherwise Fusion might behave unpredictable or crash.
+
         Args:
             interval (float): The time in seconds to wait between calls of action.
             action (Callable): The function to execute periodically. Must not accept any
@@ -920,50 +1208,108 @@ class PeriodicExecuter:
                 execute the action is included in the delay time or not. Defaults to False.
             initial_execution (bool, optional): Determines whether the first execution is
                 executed directly after the first start call or if the interval time is waited.
+            event_id (str, optional): The id of a custom event created with
+                'create_custom_event' where generic_use was set to True. If given, the
+                action is executed from this event in Fusions main thread (see
+                'execute_from_event'). In this case wait_for_action only waits until the
+                action is handed over to the event. Defaults to None (the action is
+                executed in the background thread).
         """
         self.interval = interval
         self.wait_for_func = wait_for_action
         self.action = action
+        self.event_id = event_id
 
         self._initial_delay = 0 if initial_execution else self.interval
         self._start_delay = self._initial_delay
 
-        self._timer = None
+        # the worker thread of the current run and the event which stops it
+        self._thread = None
+        self._stop_event = None
+        self._execution_timestamp = None
 
-    def _new_timer(self, delta):
-        self._timer = AnnotatedTimer(delta, self._scheduled_action)
-        self._timer.start()
+    def _run(self, stop_event: threading.Event, execution_timestamp: float):
+        """Executes the action periodically until the passed event is set.
 
-    def _cancel_timer(self):
-        self._timer.cancel()
-        self._timer = None
+        The worker blocks on the event instead of spawning a new timer thread for
+        every execution. Therfore pausing or resetting interrupts the wait immediately.
 
-    def _scheduled_action(self):
-        if self.wait_for_func:
-            self.action()
-            self._new_timer(self.interval)
-        else:
-            self._new_timer(self.interval)
-            self.action()
+        Args:
+            stop_event (threading.Event): The event which stops this worker.
+            execution_timestamp (float): The perf_counter time of the first execution.
+        """
+        # bind the loop invariant lookups to locals
+        clock = time.perf_counter
+        wait = stop_event.wait
+
+        delay = execution_timestamp - clock()
+        while not wait(delay):
+            if self.wait_for_func:
+                self._execute_action()
+                # the full interval is waited so the clock is read only once
+                delay = self.interval
+                execution_timestamp = clock() + delay
+            else:
+                # schedule relative to the previous deadline and not to the wake up
+                # time, so the wake up latencies do not add up over time
+                execution_timestamp += self.interval
+                # publish the new deadline before executing, so pausing while the
+                # action runs keeps the remaining delay
+                if not stop_event.is_set():
+                    self._execution_timestamp = execution_timestamp
+                self._execute_action()
+                now = clock()
+                delay = execution_timestamp - now
+                if delay < 0:
+                    # the action took longer than the interval, execute again right
+                    # away but do not try to catch up on the missed executions
+                    execution_timestamp = now
+            # a paused worker must not overwrite the timestamp of its successor
+            if not stop_event.is_set():
+                self._execution_timestamp = execution_timestamp
+
+    def _execute_action(self):
+        # an error in the action must not end the worker, the action is executed
+        # again in the next period (as it was with a new timer for every execution)
+        try:
+            if self.event_id is None:
+                self.action()
+            else:
+                execute_from_event(self.action, self.event_id)
+        except Exception:  # pylint:disable=broad-except
+            _logger.exception("Error while executing the action of a PeriodicExecuter.")
+
+    def _stop_thread(self):
+        self._stop_event.set()
+        self._stop_event = None
+        self._thread = None
 
     def start(self):
         """Starts the periodic execution of the action."""
-        if self._timer is None:
-            self._new_timer(self._start_delay)
+        # a worker which ended unexpectedly is replaced
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event = threading.Event()
+            self._execution_timestamp = time.perf_counter() + self._start_delay
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop_event, self._execution_timestamp),
+                daemon=True,
+            )
+            self._thread.start()
 
     def pause(self):
         """Pauses the periodic execution. This will NOT reset the delay time. So if half
         of the delay is already passed, only half of the delay will be executed after the
         executor is started again."""
-        if self._timer is not None:  # only if we are currently running / not paused
-            self._start_delay = self._timer.execution_timestamp - time.time()
-            self._cancel_timer()
+        if self._thread is not None:  # only if we are currently running / not paused
+            self._start_delay = max(0, self._execution_timestamp - time.perf_counter())
+            self._stop_thread()
 
     def reset(self):
         """Resets the delay time to its maximum/interval time again indepent of the state of the executer."""
         self._start_delay = self._initial_delay
-        if self._timer is not None:  # only if we are currently running / not paused
-            self._cancel_timer()
+        if self._thread is not None:  # only if we are currently running / not paused
+            self._stop_thread()
             self.start()
 
 
@@ -971,7 +1317,15 @@ class PeriodicExecuter:
 
 ### THREAD / CUSTOM EVENT ###
 # region
-_custom_event_queues = {}  # {id:queue}
+# deque.append and deque.popleft are atomic so no lock is needed for handing over
+# the actions from the producing threads to the event handler in the main thread
+_custom_event_queues = {}  # {id:deque}
+# ids of the generic events which are fired and not yet handled, queuing more
+# actions for these events does not need to fire them again
+_fired_custom_events = set()
+_fired_custom_events_lock = threading.Lock()
+# bound fireCustomEvent method of the application, fetched on first use
+_fire_custom_event_method = None
 
 
 def create_custom_event(
@@ -979,6 +1333,7 @@ def create_custom_event(
     action: Callable = None,
     debug_to_ui: bool = False,
     generic_use: bool = False,
+    max_queued_actions: int = None,
 ) -> adsk.core.CustomEvent:
     """Creates and registers a custom event. The event is not associated with any command.
     The custom event gets removed and cleaned up when calling the addin.stop() method.
@@ -994,6 +1349,9 @@ def create_custom_event(
                 of the action are displayed in messageBox. Defaults to False.
         generic_use (boool, optional): If you intend to use this event with the dynamic 'execute_from_even'
             functions set this to true. If this is set actiob must be None. Defaults to False.
+        max_queued_actions (int, optional): Only used if generic_use is set. The maximum
+            number of actions which are waiting to be executed from the event. If more
+            actions are queued the oldest ones are dropped. Defaults to None (unbounded).
 
     Returns:
         adsk.core.CustomEvent: The created CustomEvent.
@@ -1003,7 +1361,8 @@ def create_custom_event(
     if generic_use == True:
         assert action == None
         action = _generic_custom_event_action
-        _custom_event_queues[event_id] = Queue()
+        _custom_event_queues[event_id] = deque(maxlen=max_queued_actions)
+        _fired_custom_events.discard(event_id)
 
     custom_event = adsk.core.Application.get().registerCustomEvent(event_id)
     custom_handler = handlers.GenericCustomEventHandler(
@@ -1017,18 +1376,48 @@ def _generic_custom_event_action(
     event_args: adsk.core.CustomEventArgs,  # pylint:disable=unused-argument
 ):
     """The generic handler function used in the thread event.
-    Executes all actions which got stored in the corresponding queue.
+    Executes all actions which are stored in the corresponding queue when the
+    event is handled.
 
     Args:
         event_args (adsk.core.CustomEventArgs): The eventArgs which get passed to the handler
             notify by Fusion. However they are ignored.
     """
-    event_queue = _custom_event_queues[event_args.firingEvent.eventId]
-    while not event_queue.empty():
-        event_queue.get()()
+    event_id = event_args.firingEvent.eventId
+    event_queue = _custom_event_queues[event_id]
+    # reset before draining so actions queued from now on fire the event again
+    _fired_custom_events.discard(event_id)
+    try:
+        # drain only the actions which are queued by now, actions queued while draining
+        # fire the event again so an action which requeues itself can not block Fusion
+        for _ in range(len(event_queue)):
+            event_queue.popleft()()
+    finally:
+        # if an action raised the remaining actions must not wait for the next one
+        if event_queue:
+            _fire_custom_event(event_id)
+
+
+def _fire_custom_event(event_id: str):
+    """Fires the generic custom event unless it is already fired and not handled yet.
 
+    Args:
+        event_id (str): The id of the event to fire.
+    """
+    global _fire_custom_event_method  # pylint:disable=global-statement
 
-def execute_from_event(to_execute: Callable, event_id: str):
+    with _fired_custom_events_lock:
+        if event_id in _fired_custom_events:
+            return
+        _fired_custom_events.add(event_id)
+    if _fire_custom_event_method is None:
+        _fire_custom_event_method = adsk.core.Application.get().fireCustomEvent
+    _fire_custom_event_method(event_id)
+
+
+def execute_from_event(
+    to_execute: Callable, event_id: str, skip_duplicate: bool = False
+):
     """Utility function which allows you to execute the passed Callable from witihn a
     custom event. This is needed when you want to trigger some Fusion related actions
     from a thread or other external non Fusion stimuli. The passed Callable must not accept any
@@ -1040,11 +1429,23 @@ def execute_from_event(to_execute: Callable, event_id: str):
         event_id (str): The event id of the event from which the passed Callable gets executed.
             The event must has been created already with the 'create_custom_event' method where
             dynamic_use was set to True.
+        skip_duplicate (bool, optional): If set, the Callable is not queued again if it is
+            the last action which is still waiting to be executed. Useful for idempotent
+            actions like refreshes which are requested faster than Fusion handles them.
+            Defaults to False.
     """
-    assert event_id in _custom_event_queues.keys()
+    event_queue = _custom_event_queues.get(event_id)
+    assert event_queue is not None
 
-    _custom_event_queues[event_id].put(to_execute)
-    adsk.core.Application.get().fireCustomEvent(event_id)
+    if skip_duplicate:
+        try:
+            if event_queue[-1] is to_execute:
+                return
+        except IndexError:
+            # the queue is empty (or got drained meanwhile)
+            pass
+    event_queue.append(to_execute)
+    _fire_custom_event(event_id)
 
 
 def execute_from_event_deco(event_id: str):
@@ -1062,7 +1463,7 @@ def execute_from_event_deco(event_id: str):
     def decorator(to_decorate: Callable):
         @wraps(to_decorate)
         def decorated(*args, **kwargs):
-            execute_from_event(lambda: to_decorate(*args, **kwargs), event_id=event_id)
+            execute_from_event(partial(to_decorate, *args, **kwargs), event_id=event_id)
 
         return decorated
 
@@ -11,6 +11,8 @@ from pathlib import Path
 from abc import ABC
 from typing import Union, Callable, List, Any, Dict
 from collections import defaultdict
+from itertools import count
+from operator import itemgetter
 from uuid import uuid4
 
 import adsk.core, adsk.fusion
@@ -20,17 +22,75 @@ from . import defaults as dflts
 from . import handlers
 
 
+_logger = logging.getLogger(__name__)
+
 # List of FusionAddin instances managed by the addin. Will conatin at max one instance.
 _addins = []
 
+# dummy command definitions of controls which got a command connected mapped by
+# their control type, they are reused for the next created controls (see Control)
+_unused_dummy_cmd_defs = defaultdict(list)
+
+# ids of the dummy command definitions only need to be unique, a random prefix
+# (generated once) keeps them distinct from other addins using the framework
+_dummy_id_prefix = "faf_dummy_" + uuid4().hex + "_"
+_dummy_id_counter = count()
+
+
+def _next_dummy_id() -> str:
+    """Returns a new unique id for a dummy command definition.
+
+    Returns:
+        str: The id.
+    """
+    return _dummy_id_prefix + str(next(_dummy_id_counter))
+
+
+# the user interface object is the same for the whole Fusion session, it is
+# fetched on first use (see _get_user_interface)
+_user_interface = None
+
+
+def _get_user_interface() -> adsk.core.UserInterface:
+    """Returns the user interface of the application without resolving it again for
+    every created wrapper instance.
+
+    Returns:
+        adsk.core.UserInterface: The user interface of the application.
+    """
+    global _user_interface  # pylint:disable=global-statement
+
+    if _user_interface is None:
+        _user_interface = adsk.core.Application.get().userInterface
+    return _user_interface
+
+
+# the command definitions collection is needed for every control and command
+_command_definitions = None
+
+
+def _get_command_definitions() -> adsk.core.CommandDefinitions:
+    """Returns the command definitions collection of the user interface without
+    resolving it again for every created control and command.
+
+    Returns:
+        adsk.core.CommandDefinitions: The command definitions of the user interface.
+    """
+    global _command_definitions  # pylint:disable=global-statement
+
+    if _command_definitions is None:
+        _command_definitions = _get_user_interface().commandDefinitions
+    return _command_definitions
+
 
 def stop():
     """Stops the addin managed by this framework. See FusionAddin.stop() for details.
     This is useful if you dont ant to manage a global addin instance in your main file.
     """
+    app = adsk.core.Application.get()
     for event, handler in handlers.custom_events_and_handlers:
         event.remove(handler)
-        adsk.core.Application.get().unregisterCustomEvent(event.eventId)
+        app.unregisterCustomEvent(event.eventId)
     for a in _addins:
         a.stop()
 
@@ -61,13 +121,11 @@ class _FusionWrapper(ABC):
             parent = parent_class()
         self._parent = parent
 
-        # for now this is only the case for addincommand class
-        if isinstance(self._parent, list):
-            self._addin = self._parent[0].addin
-            self._ui_level = self._parent[0].uiLevel + 1
-        else:
-            self._addin = self._parent.addin
-            self._ui_level = self._parent.uiLevel + 1
+        # multiple parents are only possible for the addincommand class for now
+        # all parents share the same addin and ui level
+        first_parent = parent[0] if isinstance(parent, list) else parent
+        self._addin = first_parent.addin
+        self._ui_level = first_parent.uiLevel + 1
 
     def __getattr__(self, attr: str) -> Any:
         """Tries to find and return the attribute with the given name in the fusion-object
@@ -92,8 +150,14 @@ class _FusionWrapper(ABC):
             name: The name of the attribute to set.
             value: The value of the attribute to set.
         """
+        # private attributes always belong to the wrapper, this avoids probing the
+        # fusion object for every internal attribute which is set
         # avoid infinite recursion by using self.__dict__ instead of self.hasattr
-        if "_in_fusion" in self.__dict__.keys() and hasattr(self._in_fusion, name):
+        if (
+            not name.startswith("_")
+            and "_in_fusion" in self.__dict__
+            and hasattr(self._in_fusion, name)
+        ):
             setattr(self._in_fusion, name, value)
         else:
             super().__setattr__(name, value)
@@ -143,7 +207,9 @@ class FusionAddin:
         """
         self._debug_to_ui = debugToUi
 
-        self._registered_elements = defaultdict(list)
+        # (level, element) pairs in the order of registration, elements are appended
+        # for every created ui element but only sorted once when the addin stops
+        self._registered_elements = []
 
         # as we usually have the framework forked to each addin one fork of the framework only manages
         # the FusionAddin instance of a single addin
@@ -177,14 +243,24 @@ class FusionAddin:
         #     event.remove(handler)
         #     adsk.core.Application.get().unregisterCustomEvent(event.eventId)
 
-        for level in reversed(sorted(list(self._registered_elements.keys()))):
-            elems = self._registered_elements.pop(level)
-            for elem in elems:
-                try:
-                    elem.deleteMe()
-                except:  # pylint:disable=bare-except
-                    # element is probably already deleted
-                    pass
+        # the sort is stable so elements of the same level are deleted in the order
+        # they were registered
+        registered_elements = sorted(
+            self._registered_elements, key=itemgetter(0), reverse=True
+        )
+        self._registered_elements.clear()
+        # the dummy command definitions are registered elements too
+        _unused_dummy_cmd_defs.clear()
+        for _, elem in registered_elements:
+            # elements which were deleted already (e.g. the controls of the dummy
+            # command definitions) are skipped instead of provoking an error
+            if not getattr(elem, "isValid", True):
+                continue
+            try:
+                elem.deleteMe()
+            except:  # pylint:disable=bare-except
+                # stopping must not break on a single element which can not be deleted
+                pass
 
         _addins.remove(self)
 
@@ -203,7 +279,7 @@ class FusionAddin:
         """
         if isinstance(elem, _FusionWrapper):  # TODO check if still necessary
             elem = elem._in_fusion  # pylint:disable=protected-access
-        self._registered_elements[level].append(elem)
+        self._registered_elements.append((level, elem))
 
     # region
     @property
@@ -230,8 +306,12 @@ class FusionAddin:
 
     @property
     def createdElements(self):  # -> Dict[int, List[FusionApp]]:
-        """Dict[int, List[FusionApp]]: A dictonary with all the created ui elemnts mapped by their ui level."""
-        return self._registered_elements
+        """Dict[int, List[FusionApp]]: A dictonary with all the created ui elemnts mapped by their ui level.
+        The dictionary is built on access, changing it does not affect the addin."""
+        created_elements = defaultdict(list)
+        for level, elem in self._registered_elements:
+            created_elements[level].append(elem)
+        return created_elements
 
     # endregion
 
@@ -291,27 +371,26 @@ class Workspace(_FusionWrapper):
         super().__init__(parent, FusionAddin)
 
         id = dflts.eval_id(id)
-        name = dflts.eval_name(name, __class__)
-        resourceFolder = dflts.eval_image(resourceFolder)
-        toolClipFilename = dflts.eval_image(toolClipFilename, "32x32.png")
 
-        self._in_fusion = adsk.core.Application.get().userInterface.workspaces.itemById(
-            id
-        )
+        workspaces = _get_user_interface().workspaces
+        self._in_fusion = workspaces.itemById(id)
 
         if self._in_fusion is not None:
-            logging.getLogger(__name__).info(msgs.using_exisiting(__class__, id))
+            _logger.info(msgs.using_exisiting(__class__, id))
 
         else:
-            self._in_fusion = adsk.core.Application.get().userInterface.workspaces.add(
-                productType, id, name, resourceFolder
-            )
+            # the remaining arguments are only needed for a new workspace
+            name = dflts.eval_name(name, __class__)
+            resourceFolder = dflts.eval_image(resourceFolder)
+            toolClipFilename = dflts.eval_image(toolClipFilename, "32x32.png")
+
+            self._in_fusion = workspaces.add(productType, id, name, resourceFolder)
             self._in_fusion.toolClipFilename = toolClipFilename
             self._in_fusion.tooltip = tooltip
             self._in_fusion.tooltipDescription = tooltipDescription
 
             self.addin.registerElement(self, self.uiLevel)
-            logging.getLogger(__name__).info(msgs.created_new(__class__, id))
+            _logger.info(msgs.created_new(__class__, id))
 
     def tab(self, *args, **kwargs):
         """Creates a :class:`.Tab` as a child of this workspace.
@@ -355,17 +434,17 @@ class Tab(_FusionWrapper):
         super().__init__(parent, Workspace)
 
         id = dflts.eval_id(id, self)
-        name = dflts.eval_name(name, __class__)
 
         self._in_fusion = self.parent.toolbarTabs.itemById(id)
 
         if self._in_fusion:
-            logging.getLogger(__name__).info(msgs.using_exisiting(__class__, id))
+            _logger.info(msgs.using_exisiting(__class__, id))
         else:
+            name = dflts.eval_name(name, __class__)
             self._in_fusion = self.parent.toolbarTabs.add(id, name)
 
             self.addin.registerElement(self, self.uiLevel)
-            logging.getLogger(__name__).info(msgs.created_new(__class__, id))
+            _logger.info(msgs.created_new(__class__, id))
 
     def panel(self, *args, **kwargs):
         """Creates a :class:`.Panel` as a child of this tab.
@@ -417,20 +496,20 @@ class Panel(_FusionWrapper):
         super().__init__(parent, Tab)
 
         id = dflts.eval_id(id, self)
-        name = dflts.eval_name(name, __class__)
 
         # TODO test what wil happen if ui.allToolbarpanels.itemById() already exists
         self._in_fusion = self.parent.toolbarPanels.itemById(id)
 
         if self._in_fusion:
-            logging.getLogger(__name__).info(msgs.using_exisiting(__class__, id))
+            _logger.info(msgs.using_exisiting(__class__, id))
         else:
+            name = dflts.eval_name(name, __class__)
             self._in_fusion = self.parent.toolbarPanels.add(
                 id, name, positionID, isBefore
             )
 
             self.addin.registerElement(self, self.uiLevel)
-            logging.getLogger(__name__).info(msgs.created_new(__class__, id))
+            _logger.info(msgs.created_new(__class__, id))
 
     # region
     # def button(self, *args, **kwargs):
@@ -530,20 +609,20 @@ class Dropdown(_FusionWrapper):
         super().__init__(parent, Panel)
 
         id = dflts.eval_id(id)
-        text = dflts.eval_name(text, __class__)
-        resourceFolder = dflts.eval_image(resourceFolder)
 
         self._in_fusion = self.parent.controls.itemById(id)
 
         if self._in_fusion:
-            logging.getLogger(__name__).info(msgs.using_exisiting(__class__, id))
+            _logger.info(msgs.using_exisiting(__class__, id))
         else:
+            text = dflts.eval_name(text, __class__)
+            resourceFolder = dflts.eval_image(resourceFolder)
             self._in_fusion = self.parent.controls.addDropDown(
                 text, resourceFolder, id, positionID, isBefore
             )
             self._in_fusion.isVisible = isVisible
             self.addin.registerElement(self, self.uiLevel)
-            logging.getLogger(__name__).info(msgs.created_new(__class__, id))
+            _logger.info(msgs.created_new(__class__, id))
 
     def control(self, *args, **kwargs):
         """Creates a :class:`.Control` as a child of this workspace.
@@ -636,44 +715,80 @@ class Control(_FusionWrapper):
         self._isPromotedByDefault = isPromotedByDefault
         self._positionID = positionID
         self._isBefore = isBefore
+        self._control_type = None
+        self._dummy_cmd_def = None
 
         # create a dummy control so a control is displayed in the UI even if no
         # command was created
+        # dummy definitions which were replaced by a command are reused
+        # get() does not add an entry for an invalid control type to the pool
+        unused_dummy_cmd_defs = _unused_dummy_cmd_defs.get(controlType)
+        if unused_dummy_cmd_defs:
+            dummy_cmd_def = unused_dummy_cmd_defs.pop()
+            if controlType == "checkbox":
+                # might have been checked by the user
+                dummy_cmd_def.controlDefinition.isChecked = False
+        else:
+            dummy_cmd_def = self._create_dummy_command_definition(controlType)
+        self._control_type = controlType
+        self._dummy_cmd_def = dummy_cmd_def
+
+        self._create_control(dummy_cmd_def)
+
+        _logger.info(msgs.created_new(__class__, None))
+
+    def _create_dummy_command_definition(
+        self, controlType: str
+    ) -> adsk.core.CommandDefinition:
+        """Creates and registers a command definition without any functionality which
+        is used to display the control before a command is connected.
+
+        Args:
+            controlType (str): See __init__.
+
+        Raises:
+            ValueError: If the control type is not in {"button", "checkbox", "list"}
+
+        Returns:
+            adsk.core.CommandDefinition: The dummy command definition.
+        """
+        cmd_defs = _get_command_definitions()
         if controlType == "button":
-            dummy_cmd_def = adsk.core.Application.get().userInterface.commandDefinitions.addButtonDefinition(
-                str(uuid4()),
+            dummy_cmd_def = cmd_defs.addButtonDefinition(
+                _next_dummy_id(),
                 "<no command connected>",
                 "",
                 dflts.eval_image("transparent"),
             )
+            control_def = dummy_cmd_def.controlDefinition
         elif controlType == "checkbox":
-            dummy_cmd_def = adsk.core.Application.get().userInterface.commandDefinitions.addCheckBoxDefinition(
-                str(uuid4()),
+            dummy_cmd_def = cmd_defs.addCheckBoxDefinition(
+                _next_dummy_id(),
                 "<no command connected>",
                 "",
                 False,
             )
-            dummy_cmd_def.controlDefinition.isChecked = False
+            control_def = dummy_cmd_def.controlDefinition
+            control_def.isChecked = False
         elif controlType == "list":
-            dummy_cmd_def = adsk.core.Application.get().userInterface.commandDefinitions.addListDefinition(
-                str(uuid4()),
+            dummy_cmd_def = cmd_defs.addListDefinition(
+                _next_dummy_id(),
                 "<no command connected>",
                 adsk.core.ListControlDisplayTypes.RadioButtonlistType,
             )
-            dummy_cmd_def.controlDefinition.listItems.add("<empty list>", False)
+            control_def = dummy_cmd_def.controlDefinition
+            control_def.listItems.add("<empty list>", False)
         else:
             raise ValueError(msgs.invalid_control_type(controlType))
 
-        dummy_cmd_def.controlDefinition.isVisible = True
-        dummy_cmd_def.controlDefinition.isEnabled = True
-        dummy_cmd_def.controlDefinition.name = "<no command connected>"
+        control_def.isVisible = True
+        control_def.isEnabled = True
+        control_def.name = "<no command connected>"
         # do not connect a handler since its a dummy cmd_def
 
         self.addin.registerElement(dummy_cmd_def, self.uiLevel + 1)
 
-        self._create_control(dummy_cmd_def)
-
-        logging.getLogger(__name__).info(msgs.created_new(__class__, None))
+        return dummy_cmd_def
 
     def _create_control(self, cmd_def):
         """Creates a control with the properties that are passed at the initialization
@@ -690,6 +805,11 @@ class Control(_FusionWrapper):
         if self._in_fusion is not None:
             self._in_fusion.deleteMe()
 
+        # the replaced dummy definition can be used by the next control of this type
+        if self._dummy_cmd_def is not None and cmd_def is not self._dummy_cmd_def:
+            _unused_dummy_cmd_defs[self._control_type].append(self._dummy_cmd_def)
+            self._dummy_cmd_def = None
+
         # create the control itself with the passed cmd def and the attributs from
         # the init call
         self._in_fusion = self.parent.controls.addCommand(
@@ -948,25 +1068,22 @@ class AddinCommand(_FusionWrapper):
         super().__init__(parent, Control)
 
         # initial argument sanitation
-        if not isinstance(self._parent, list):
-            parent_list = [self._parent]
-        else:
-            parent_list = self._parent
+        parent_list = self._parent if isinstance(self._parent, list) else [self._parent]
 
         self._validate_handler_dict(eventHandlers)
 
         id = dflts.eval_id(id)
-        name = dflts.eval_name(name, __class__)
-        resourceFolder = dflts.eval_image(resourceFolder)
-        toolClipFileName = dflts.eval_image(toolClipFileName, "32x32.png")
 
         # build the command definition and connected the handlers
-        self._in_fusion = (
-            adsk.core.Application.get().userInterface.commandDefinitions.itemById(id)
-        )
+        self._in_fusion = _get_command_definitions().itemById(id)
         if self._in_fusion:
-            logging.getLogger(__name__).info(msgs.using_exisiting(__class__, id))
+            _logger.info(msgs.using_exisiting(__class__, id))
         else:
+            # the remaining arguments are only needed for a new command definition
+            name = dflts.eval_name(name, __class__)
+            resourceFolder = dflts.eval_image(resourceFolder)
+            toolClipFileName = dflts.eval_image(toolClipFileName, "32x32.png")
+
             self._in_fusion = self._create_command_definition(
                 id,
                 name,
@@ -991,7 +1108,7 @@ class AddinCommand(_FusionWrapper):
             p._create_control(self._in_fusion)  # pylint:disable=protected-access
 
         self.addin.registerElement(self, self.uiLevel)
-        logging.getLogger(__name__).info(msgs.created_new(__class__, id))
+        _logger.info(msgs.created_new(__class__, id))
 
     def _create_command_definition(
         self,
@@ -1022,48 +1139,49 @@ class AddinCommand(_FusionWrapper):
             listControlDisplayType (int): See __init__.
 
         Raises:
-            ValueError: If the control type of the parent is not in {adsk.core.ButtonControlDefinition,
-                adsk.core.CheckBoxControlDefinition, adsk.core.ListControlDefinition}
+            ValueError: If the control type of the parent is not in {"button", "checkbox", "list"}
 
         Returns:
             adsk.core.CommandDefinition: The new build command definition.
         """
         # create definition depending on the parent(s) control type
-        parent_control_type = parent_list[
-            0
-        ].commandDefinition.controlDefinition.objectType
+        # the control wrapper knows its type, so the control definition of its
+        # (dummy) command definition does not need to be inspected
+        control_type = parent_list[0]._control_type  # pylint:disable=protected-access
 
-        if parent_control_type == adsk.core.ButtonControlDefinition.classType():
-            cmd_def = adsk.core.Application.get().userInterface.commandDefinitions.addButtonDefinition(
+        cmd_defs = _get_command_definitions()
+        if control_type == "button":
+            cmd_def = cmd_defs.addButtonDefinition(
                 id,
                 name,
                 tooltip,
                 resourceFolder,
             )
-        elif parent_control_type == adsk.core.CheckBoxControlDefinition.classType():
-            cmd_def = adsk.core.Application.get().userInterface.commandDefinitions.addCheckBoxDefinition(
+        elif control_type == "checkbox":
+            cmd_def = cmd_defs.addCheckBoxDefinition(
                 id,
                 name,
                 tooltip,
                 isChecked,
             )
-        elif parent_control_type == adsk.core.ListControlDefinition.classType():
-            cmd_def = adsk.core.Application.get().userInterface.commandDefinitions.addListDefinition(
+        elif control_type == "list":
+            cmd_def = cmd_defs.addListDefinition(
                 id,
                 name,
                 listControlDisplayType,
                 resourceFolder,
             )
         else:
-            raise ValueError(msgs.invalid_control_type(parent_control_type))
+            raise ValueError(msgs.invalid_control_type(control_type))
 
         if toolClipFileName is not None:
             cmd_def.toolClipFilename = toolClipFileName
         cmd_def.tooltip = tooltip
         cmd_def.resourceFolder = resourceFolder
-        cmd_def.controlDefinition.isEnabled = isEnabled
-        cmd_def.controlDefinition.isVisible = isVisible
-        cmd_def.controlDefinition.name = name
+        control_def = cmd_def.controlDefinition
+        control_def.isEnabled = isEnabled
+        control_def.isVisible = isVisible
+        control_def.name = name
 
         return cmd_def
 
@@ -1089,14 +1207,20 @@ class AddinCommand(_FusionWrapper):
         The control should be of the same control type as the other controls of
         this command.
 
+        Adding a control which is already a parent of this command has no effect.
+
         Args:
             parent (Control): The additional control for the command.
         """
+        if not isinstance(self._parent, list):
+            self._parent = [self._parent]
+        # the control of an existing parent would be recreated for nothing
+        if parentControl in self._parent:
+            return
+
         parentControl._create_control(  # pylint:disable=protected-access
             self._in_fusion
         )
-        if not isinstance(self._parent, list):
-            self._parent = [self._parent]
         self._parent.append(parentControl)
 
     def __getattr__(self, attr):
@@ -1112,9 +1236,10 @@ class AddinCommand(_FusionWrapper):
         Returns:
             Any: The attribute value.
         """
-        if hasattr(self._in_fusion, attr):
+        # a hasattr check would look up the attribute twice for every hit
+        try:
             return getattr(self._in_fusion, attr)
-        else:  # hasattr(self._in_fusion.controlDefinition, attr):
+        except AttributeError:
             return getattr(self._in_fusion.controlDefinition, attr)
 
     def __setattr__(self, name, value):
@@ -1127,8 +1252,13 @@ class AddinCommand(_FusionWrapper):
             name: The name of the attribute to set.
             value: The value of the attribute to set.
         """
+        # private attributes always belong to the wrapper (see _FusionWrapper)
         # avoid infinite recursion by using self.__dict__ instead of self.hasattr
-        if "_in_fusion" in self.__dict__.keys() and self._in_fusion is not None:
+        if (
+            not name.startswith("_")
+            and "_in_fusion" in self.__dict__
+            and self._in_fusion is not None
+        ):
             if hasattr(self._in_fusion, name):
                 setattr(self._in_fusion, name, value)
             elif hasattr(self._in_fusion.controlDefinition, name):
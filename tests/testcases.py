@@ -8,6 +8,7 @@ file which is the entry point for testing.
 
 from uuid import uuid4
 import random
+import threading
 
 import adsk.fusion, adsk.core
 
@@ -963,6 +964,26 @@ def test_thread_event_utility():
         raise test_exception
 
 
+def test_executer_pause_during_action():
+    action_started = threading.Event()
+    finish_action = threading.Event()
+
+    def action():
+        action_started.set()
+        finish_action.wait(5)
+
+    executer = faf.utils.PeriodicExecuter(1.0, action, initial_execution=True)
+    try:
+        executer.start()
+        assert action_started.wait(5)
+        executer.pause()
+        # the deadline of the next execution was already set when the action started
+        assert executer._start_delay > 0.5  # pylint:disable=protected-access
+    finally:
+        finish_action.set()
+        executer.pause()
+
+
 @faf.utils.execute_as_event_deco()
 def decorated_action(show="42"):
     adsk.core.Application.get().userInterface.messageBox(show)
@@ -1038,6 +1059,7 @@ ALL_CASES = [
     # pops up a window every few seconds and therefore no included in main test suite
     # test_thread_event_utility,
     # test_thread_event_decorator,
+    test_executer_pause_during_action,
     test_execute_as_event_decorator,
     test_subclass_pattern,
 ]